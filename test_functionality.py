@@ -55,11 +55,17 @@ if __name__ == '__main__':
 
 """
 
+import asyncio
+import queue
+import threading
 import unittest
+from unittest.mock import patch
+
+import app
 from app import respond, cancel_inference
 
 class TestChatbot(unittest.TestCase):
-    
+
     def setUp(self):
         self.message = "What should I eat today?"
         self.history = [("Hello", "Hi! How can I assist you today?")]
@@ -69,6 +75,11 @@ class TestChatbot(unittest.TestCase):
         self.top_p = 0.95
         self.use_local_model = False
 
+    def first_response(self, generator):
+        # respond is an async generator now; pull its first yield.
+        # Each yield is a (chat history, messages state) pair.
+        return asyncio.run(generator.__anext__())
+
     def test_respond_with_local_model(self):
         # Test with local model
         self.use_local_model = True
@@ -81,7 +92,7 @@ class TestChatbot(unittest.TestCase):
             top_p=self.top_p,
             use_local_model=self.use_local_model,
         )
-        result = next(generator)
+        result, messages = self.first_response(generator)
         self.assertIsInstance(result, list)
         self.assertEqual(result[-1][0], self.message)
 
@@ -97,14 +108,37 @@ class TestChatbot(unittest.TestCase):
             top_p=self.top_p,
             use_local_model=self.use_local_model,
         )
-        result = next(generator)
+        result, messages = self.first_response(generator)
         self.assertIsInstance(result, list)
         self.assertEqual(result[-1][0], self.message)
 
+    def test_local_worker_batches_requests(self):
+        # Two users queued with matching settings should run as one batched
+        # pipeline call, and each should get its own result plus sentinel
+        gen_kwargs = {"max_new_tokens": 10, "temperature": 0.7, "do_sample": True, "top_p": 0.95}
+        first_q, second_q = queue.Queue(), queue.Queue()
+        batch = [
+            ([{"role": "user", "content": "hi"}], gen_kwargs, first_q),
+            ([{"role": "user", "content": "hello"}], gen_kwargs, second_q),
+        ]
+        fake_outputs = [
+            [{"generated_text": [{"content": "first reply"}]}],
+            [{"generated_text": [{"content": "second reply"}]}],
+        ]
+        with patch("app.pipe", return_value=fake_outputs) as mock_pipe:
+            app._process_batch(batch)
+        self.assertEqual(mock_pipe.call_count, 1)
+        self.assertEqual(mock_pipe.call_args.kwargs["batch_size"], 2)
+        self.assertEqual(first_q.get_nowait(), "first reply")
+        self.assertIsNone(first_q.get_nowait())
+        self.assertEqual(second_q.get_nowait(), "second reply")
+        self.assertIsNone(second_q.get_nowait())
+
     def test_cancel_inference(self):
         # Test if inference can be canceled
-        cancel_inference()  # This should set the global stop_inference flag to True
-        self.assertTrue(cancel_inference)
+        event = threading.Event()
+        cancel_inference(event)  # This should set the caller's cancellation event
+        self.assertTrue(event.is_set())
 
 if __name__ == "__main__":
     unittest.main()